@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from django.db.models import CASCADE, DecimalField, FloatField, ForeignKey
 from django.utils.translation import gettext_lazy as _
 from model_utils.models import TimeStampedModel
@@ -15,12 +17,12 @@ class ExtraFee(TimeStampedModel, UserStampedModel):
     product = ForeignKey(Product, verbose_name=_("Product"), on_delete=CASCADE, null=True, blank=True)
     processing_task = ForeignKey(ProcessingTask, verbose_name=_("Processing Task"), on_delete=CASCADE)
 
-    unit_price = DecimalField(_("Unit Price"), max_digits=20, decimal_places=2, default=0.00)
+    unit_price = DecimalField(_("Unit Price"), max_digits=20, decimal_places=2, default=Decimal("0"))
     unit_percentage = FloatField(_("Percentage"), blank=True, null=True, default=0)
 
     quantity = FloatField(_("Quantity"), blank=True, null=True, default=1)
-    unit_amount = DecimalField(_("Unit Amount"), max_digits=20, decimal_places=2, default=0.00)
-    total_amount = DecimalField(_("Total Amount"), max_digits=20, decimal_places=2, default=0.00)
+    unit_amount = DecimalField(_("Unit Amount"), max_digits=20, decimal_places=2, default=Decimal("0"))
+    total_amount = DecimalField(_("Total Amount"), max_digits=20, decimal_places=2, default=Decimal("0"))
 
     class Meta:
         verbose_name = _("Extra Fee")
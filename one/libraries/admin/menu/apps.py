@@ -5,3 +5,9 @@ from django.utils.translation import gettext_lazy as _
 class MenusConfig(AppConfig):
     name = "one.libraries.admin.menu"
     verbose_name = _("Admin Menu")
+
+    def ready(self):
+        try:
+            import one.libraries.admin.menu.signals  # noqa: F401
+        except ImportError:
+            pass
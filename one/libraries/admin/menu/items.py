@@ -1,3 +1,5 @@
+from types import MemberDescriptorType
+
 from django.apps import apps as django_apps
 
 from one.libraries.admin.menu.constants import MENU_EXTRA_DETAILS
@@ -43,30 +45,84 @@ class MenuItem:
         the ``MenuItem`` class.
     """
 
-    title = "Untitled menu item"
-    url = "#"
-    fas_icon = None
-    css_classes = None
-    accesskey = None
-    description = None
-    enabled = True
-    template = "libraries/menu/item.html"
-    children = None
-    is_short = False
+    __slots__ = (
+        "title",
+        "url",
+        "fas_icon",
+        "css_classes",
+        "accesskey",
+        "description",
+        "enabled",
+        "template",
+        "children",
+        "is_short",
+    )
+
+    # slots cannot carry class level defaults, they are applied in __init__
+    # unless a subclass overrides them with a class attribute
+    _defaults = {
+        "title": "Untitled menu item",
+        "url": "#",
+        "fas_icon": None,
+        "css_classes": None,
+        "accesskey": None,
+        "description": None,
+        "enabled": True,
+        "template": "libraries/menu/item.html",
+        "children": None,
+        "is_short": False,
+    }
 
     def __init__(self, title=None, url=None, **kwargs):
+        for key, value in self._class_defaults().items():
+            setattr(self, key, value)
+
+        for key in self._class_attrs().intersection(kwargs):
+            setattr(self, key, kwargs[key])
+
         if title is not None:
             self.title = title
 
         if url is not None:
             self.url = url
 
-        for key in kwargs:
-            if hasattr(self.__class__, key):
-                setattr(self, key, kwargs[key])
         self.children = self.children or []
         self.css_classes = self.css_classes or []
 
+    @classmethod
+    def _class_defaults(cls):
+        """
+        Returns the ``_defaults`` that ``cls`` does not override with a class
+        attribute, resolved once per class.
+        """
+        defaults = cls.__dict__.get("_resolved_defaults")
+        if defaults is None:
+            defaults = {
+                key: value
+                for key, value in cls._defaults.items()
+                if isinstance(getattr(cls, key), MemberDescriptorType)
+            }
+            cls._resolved_defaults = defaults
+        return defaults
+
+    @classmethod
+    def _class_attrs(cls):
+        """
+        Returns the attribute names that can be set from keyword arguments:
+        the public, non callable attributes declared along the class MRO, so
+        subclasses extend it just by declaring class attributes.
+        """
+        attrs = cls.__dict__.get("_resolved_attrs")
+        if attrs is None:
+            attrs = frozenset(
+                name
+                for klass in cls.__mro__
+                for name, value in vars(klass).items()
+                if not name.startswith("_") and not callable(value)
+            )
+            cls._resolved_attrs = attrs
+        return attrs
+
     def init_with_context(self, context):
         """
         Like for menus, menu items have a ``init_with_context`` method that is
@@ -111,8 +167,10 @@ class MenuItem:
         A menu item is considered as active if it's URL or one of its
         descendants URL is equals to the current URL.
         """
-        current_url = request.get_full_path()
-        return self.url == current_url or len([c for c in self.children if c.is_selected(request)]) > 0
+        return self._is_selected(request.get_full_path())
+
+    def _is_selected(self, current_url):
+        return self.url == current_url or any(c._is_selected(current_url) for c in self.children)  # noqa
 
     def is_empty(self):
         """
@@ -166,12 +224,14 @@ class AppList(MenuItem, AppListElementMixin):
         displayed in the menu.
     """
 
+    __slots__ = ("models", "exclude", "include_list", "exclude_list", "icon")
+
     def __init__(self, title=None, **kwargs):
         """
         ``AppListMenuItem`` constructor.
         """
-        self.models = list(kwargs.pop("models", []))
-        self.exclude = list(kwargs.pop("exclude", []))
+        self.models = kwargs.pop("models", None) or ()
+        self.exclude = kwargs.pop("exclude", None) or ()
         self.include_list = kwargs.pop("include_list", [])  # deprecated
         self.exclude_list = kwargs.pop("exclude_list", [])  # deprecated
         self.icon = kwargs.pop("icon", None)
@@ -183,43 +243,44 @@ class AppList(MenuItem, AppListElementMixin):
         :meth:`~admin_tools.menu.items.MenuItem.init_with_context`
         documentation from :class:`~admin_tools.menu.items.MenuItem` class.
         """
-        items = self._visible_models(context["request"])
+        allowed = self._allowed_models(context["request"])
+        for title, url, icon, models in self._get_skeleton(context, self._build_skeleton):
+            children = [MenuItem(title=m_title, url=m_url) for model, m_title, m_url in models if model in allowed]
+            if children:
+                self.children.append(MenuItem(title=title, url=url, fas_icon=icon, children=children))
+
+    def _build_skeleton(self, models, context):
+        """
+        Returns the sorted ``(title, url, icon, models)`` app entries for
+        ``models``, before any permission filtering.
+        """
+        app_configs = django_apps.app_configs
         apps = {}
-        for model, perms in items:
-            if not (perms["change"] or perms.get("view", False)):
-                continue
+        for model in models:
             app_label = model._meta.app_label  # noqa
             if app_label not in apps:
                 apps[app_label] = {
-                    "app_label": app_label,
-                    "title": django_apps.get_app_config(app_label).verbose_name,
+                    "title": app_configs[app_label].verbose_name,
                     "url": self._get_admin_app_list_url(model, context),
                     "models": [],
                 }
             apps[app_label]["models"].append(
-                {
-                    "app_label": app_label,
-                    "title": model._meta.verbose_name_plural,  # noqa
-                    "url": self._get_admin_change_url(model, context),
-                }
+                (
+                    model,
+                    model._meta.verbose_name_plural,  # noqa
+                    self._get_admin_change_url(model, context),
+                )
             )
 
-        for app in sorted(apps.keys()):
-            app_dict = apps[app]
-            title = app_dict["title"]
-            icon = "fa-cube"
-            if app in MENU_EXTRA_DETAILS:
-                if "title" in MENU_EXTRA_DETAILS[app]:
-                    title = MENU_EXTRA_DETAILS[app]["title"]
-                if "icon" in MENU_EXTRA_DETAILS[app]:
-                    icon = MENU_EXTRA_DETAILS[app]["icon"]
-
-            item = MenuItem(title=title, url=app_dict["url"], fas_icon=icon)
+        skeleton = []
+        for app, app_dict in sorted(apps.items()):
+            details = MENU_EXTRA_DETAILS.get(app, {})
+            title = details.get("title", app_dict["title"])
+            icon = details.get("icon", "fa-cube")
             # sort model list alphabetically
-            apps[app]["models"].sort(key=lambda x: x["title"])
-            for model_dict in apps[app]["models"]:
-                item.children.append(MenuItem(**model_dict))
-            self.children.append(item)
+            app_dict["models"].sort(key=lambda x: x[1])
+            skeleton.append((title, app_dict["url"], icon, app_dict["models"]))
+        return skeleton
 
     def is_empty(self):
         """
@@ -237,7 +298,7 @@ class AppList(MenuItem, AppListElementMixin):
         # >>> item.is_empty()
         True
         """
-        return len(self.children) == 0
+        return not self.children
 
 
 class ModelList(MenuItem, AppListElementMixin):
@@ -277,12 +338,14 @@ class ModelList(MenuItem, AppListElementMixin):
         displayed in the menu.
     """
 
+    __slots__ = ("models", "exclude", "include_list", "exclude_list", "icon")
+
     def __init__(self, title=None, models=None, exclude=None, **kwargs):
         """
         ``ModelList`` constructor.
         """
-        self.models = list(models or [])
-        self.exclude = list(exclude or [])
+        self.models = models or ()
+        self.exclude = exclude or ()
         self.include_list = kwargs.pop("include_list", [])  # deprecated
         self.exclude_list = kwargs.pop("exclude_list", [])  # deprecated
         self.icon = kwargs.pop("icon", "bi-three-dots")
@@ -295,14 +358,20 @@ class ModelList(MenuItem, AppListElementMixin):
         :meth:`~admin_tools.menu.items.MenuItem.init_with_context`
         documentation from :class:`~admin_tools.menu.items.MenuItem` class.
         """
-        items = self._visible_models(context["request"])
-        for model, perms in items:
-            if not (perms["change"] or perms.get("view", False)):
-                continue
-            title = model._meta.verbose_name_plural  # noqa
-            url = self._get_admin_change_url(model, context)
-            item = MenuItem(title=title, url=url)
-            self.children.append(item)
+        allowed = self._allowed_models(context["request"])
+        for model, title, url in self._get_skeleton(context, self._build_skeleton):
+            if model in allowed:
+                self.children.append(MenuItem(title=title, url=url))
+
+    def _build_skeleton(self, models, context):
+        """
+        Returns the ``(model, title, url)`` entries for ``models``, before any
+        permission filtering.
+        """
+        return [
+            (model, model._meta.verbose_name_plural, self._get_admin_change_url(model, context))  # noqa
+            for model in models
+        ]
 
     def is_empty(self):
         """
@@ -320,4 +389,4 @@ class ModelList(MenuItem, AppListElementMixin):
         # >>> item.is_empty()
         # True
         """
-        return len(self.children) == 0
+        return not self.children
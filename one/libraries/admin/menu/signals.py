@@ -0,0 +1,9 @@
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+
+from one.libraries.admin.utils import AppListElementMixin
+
+
+@receiver(post_migrate)
+def clear_menu_skeletons(sender, **kwargs):
+    AppListElementMixin._skeletons.clear()  # noqa
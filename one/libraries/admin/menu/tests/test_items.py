@@ -0,0 +1,71 @@
+import pytest
+from django.contrib.auth.models import Permission
+
+from one.libraries.admin.menu.items import MenuItem, ModelList
+from one.libraries.admin.utils import AppListElementMixin
+from one.users.tests.factories import UserFactory
+
+
+class HistoryMenuItem(MenuItem):
+    title = "History"
+    template = "libraries/menu/history.html"
+
+
+def test_menu_item_defaults():
+    item = MenuItem()
+    assert item.title == "Untitled menu item"
+    assert item.url == "#"
+    assert item.template == "libraries/menu/item.html"
+    assert item.children == []
+    assert item.css_classes == []
+
+
+def test_subclass_attributes_survive_construction():
+    item = HistoryMenuItem()
+    assert item.title == "History"
+    assert item.template == "libraries/menu/history.html"
+    assert item.url == "#"
+
+
+def test_arguments_override_subclass_attributes():
+    item = HistoryMenuItem("Recent", template="libraries/menu/item.html")
+    assert item.title == "Recent"
+    assert item.template == "libraries/menu/item.html"
+    assert HistoryMenuItem().title == "History"
+
+
+def test_subclass_attributes_accepted_as_arguments():
+    class LimitedMenuItem(MenuItem):
+        limit = 10
+
+    item = LimitedMenuItem(limit=5, fas_icon="fa-clock", unknown=True)
+    assert item.limit == 5
+    assert item.fas_icon == "fa-clock"
+    assert not hasattr(item, "unknown")
+    assert LimitedMenuItem().limit == 10
+
+
+@pytest.fixture
+def skeletons():
+    AppListElementMixin._skeletons.clear()  # noqa
+    yield AppListElementMixin._skeletons  # noqa
+    AppListElementMixin._skeletons.clear()  # noqa
+
+
+def _model_list_titles(rf, user):
+    request = rf.get("/admin/")
+    request.user = user
+    item = ModelList("Platform", models=("one.users.*", "django.contrib.auth.*"))
+    item.init_with_context({"request": request})
+    return [str(child.title) for child in item.children]
+
+
+def test_model_list_filters_shared_skeleton_by_permissions(db, rf, skeletons):
+    user_viewer = UserFactory()
+    user_viewer.user_permissions.add(Permission.objects.get(codename="view_user"))
+    group_viewer = UserFactory()
+    group_viewer.user_permissions.add(Permission.objects.get(codename="view_group"))
+
+    assert _model_list_titles(rf, user_viewer) == ["users"]
+    assert _model_list_titles(rf, group_viewer) == ["groups"]
+    assert len(skeletons) == 1
@@ -5,7 +5,8 @@ import warnings
 from fnmatch import fnmatch
 
 from django.contrib import admin
-from django.urls import reverse
+from django.urls import get_script_prefix, reverse
+from django.utils.translation import get_language
 
 
 def get_admin_site(context=None, request=None):
@@ -18,6 +19,12 @@ def get_admin_site_name(context):
 
 def get_avail_models(request):
     """Returns (model, perm,) for all models user can possibly see"""
+    # every AppList/ModelList of a menu asks for the same registry scan,
+    # so compute it once per request
+    items = getattr(request, "_menu_avail_models", None)
+    if items is not None:
+        return items
+
     items = []
     admin_site = get_admin_site(request=request)
 
@@ -31,15 +38,15 @@ def get_avail_models(request):
                 perms,
             )
         )
+    request._menu_avail_models = items
     return items
 
 
-def filter_models(request, models, exclude):  # noqa: C901
+def match_models(items, models, exclude):  # noqa: C901
     """
-    Returns (model, perm,) for all models that match models/exclude patterns
-    and are visible by current user.
+    Returns the (model, ...) items that match models/exclude patterns,
+    regardless of the current user.
     """
-    items = get_avail_models(request)
     included = []
 
     def full_name(cls_model):
@@ -88,7 +95,13 @@ class AppListElementMixin:
     Mixin class used by AppListMenuItem
     """
 
-    def _visible_models(self, request):
+    __slots__ = ()
+
+    # request independent part of the menu (matched models, titles and urls),
+    # shared by every item with the same patterns
+    _skeletons = {}
+
+    def _model_patterns(self):
         # compatibility layer: generate models/exclude patterns
         # from include_list/exclude_list args
 
@@ -108,14 +121,47 @@ class AppListElementMixin:
                 DeprecationWarning,
             )
 
-        included = self.models[:]  # noqa
-        included.extend([elem + "*" for elem in self.include_list])  # noqa
+        # models/exclude are stored as given (list or tuple), never mutate them
+        included = [*self.models, *(elem + "*" for elem in self.include_list)]  # noqa
 
-        excluded = self.exclude[:]  # noqa
-        excluded.extend([elem + "*" for elem in self.exclude_list])  # noqa
+        excluded = [*self.exclude, *(elem + "*" for elem in self.exclude_list)]  # noqa
         if self.exclude_list and not included:  # noqa
             included = ["*"]
-        return filter_models(request, included, excluded)
+        return included, excluded
+
+    def _allowed_models(self, request):
+        """
+        Returns the set of models the current user can change or view.
+        """
+        allowed = getattr(request, "_menu_allowed_models", None)
+        if allowed is None:
+            allowed = {
+                model for model, perms in get_avail_models(request) if perms["change"] or perms.get("view", False)
+            }
+            request._menu_allowed_models = allowed
+        return allowed
+
+    def _get_skeleton(self, context, build):
+        """
+        Returns ``build(models, context)`` for the registered models matching
+        this item's patterns, computed once and cached for later requests.
+        """
+        included, excluded = self._model_patterns()
+        # reversed urls embed the script prefix, titles the active language
+        key = (
+            type(self),
+            tuple(included),
+            tuple(excluded),
+            get_admin_site_name(context),
+            get_script_prefix(),
+            get_language(),
+        )
+        skeleton = self._skeletons.get(key)
+        if skeleton is None:
+            registry = list(get_admin_site(context)._registry.items())  # noqa
+            models = [model for model, model_admin in match_models(registry, included, excluded)]
+            skeleton = self._skeletons[key] = build(models, context)
+        return skeleton
 
     def _get_admin_app_list_url(self, model, context):  # noqa
         """
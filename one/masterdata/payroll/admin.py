@@ -1,3 +1,5 @@
+import copy
+
 from django.contrib import admin
 
 from one.libraries.utils.admin import GenericRelationAdmin, MasterModelAdmin
@@ -7,18 +9,29 @@ from .models import Payroll
 
 @admin.register(Payroll)
 class PayrollAdmin(GenericRelationAdmin, MasterModelAdmin):
+    def __init__(self, model, admin_site):
+        super().__init__(model, admin_site)
+        # the layouts don't depend on the request, build them once per admin
+        self._fieldsets = {}
+        self._list_display = None
+
     def get_fieldsets(self, request, obj=None):
-        fieldsets = super().get_fieldsets(request, obj)
-        fieldsets[0][1]["fields"] += (
-            "content_type",
-            "object_id",
-            "is_active",
-            "effective_date",
-            "expiry_date",
-            "allowance",
-        )
-        return fieldsets
+        change = bool(obj)
+        if change not in self._fieldsets:
+            fieldsets = copy.deepcopy(super().get_fieldsets(request, obj))
+            fieldsets[0][1]["fields"] += (
+                "content_type",
+                "object_id",
+                "is_active",
+                "effective_date",
+                "expiry_date",
+                "allowance",
+            )
+            self._fieldsets[change] = fieldsets
+        return self._fieldsets[change]
 
     def get_list_display(self, request):
-        list_display = super().get_list_display(request)
-        return list_display + ("content_object", "effective_date", "expiry_date", "allowance")
+        if self._list_display is None:
+            list_display = super().get_list_display(request)
+            self._list_display = list_display + ("content_object", "effective_date", "expiry_date", "allowance")
+        return self._list_display
@@ -1,7 +1,12 @@
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
 
 from one.masterdata.uom.models import UOM
 
+BATCH_SIZE = getattr(settings, "UOM_SEED_BATCH_SIZE", 500)
+
 
 class Command(BaseCommand):
     help = "Create UOM objects"
@@ -28,17 +33,48 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument("business_type", choices=["CREATIVE"], help="Business Type", default="creative")
 
+    @transaction.atomic
     def handle(self, *args, **options):
         uom_data = self.uom_data["CREATIVE"]
         business_type = options.get("business_type", None)
         if business_type:
             uom_data = self.uom_data[business_type.upper()]
-        for uom in uom_data:
-            UOM.objects.update_or_create(code=uom["code"], name=uom["name"])
-        for uom in uom_data:
-            uom_obj = UOM.objects.get(code=uom["code"])
-            if uom.get("base_uom", None):
-                base_uom = UOM.objects.get(code=uom["base_uom"])
-                uom_obj.base_uom = base_uom
-                uom_obj.save()
+        codes = {uom["code"] for uom in uom_data} | {uom["base_uom"] for uom in uom_data if uom.get("base_uom")}
+        uom_map = UOM.objects.in_bulk(codes, field_name="code")
+
+        # bases are inserted in an earlier round than the units pointing at them, so base_uom
+        # is set on creation; only new or changed rows are written, re-running is a no-op
+        # bulk_update skips AutoLastModifiedField.pre_save, stamp changed rows ourselves
+        now = timezone.now()
+        to_update = []
+        pending = uom_data
+        while pending:
+            to_create = []
+            deferred = []
+            for uom in pending:
+                base_uom = None
+                if uom.get("base_uom", None):
+                    base_uom = uom_map.get(uom["base_uom"])
+                    if base_uom is None or base_uom.pk is None:
+                        deferred.append(uom)
+                        continue
+                uom_obj = uom_map.get(uom["code"])
+                if uom_obj is None:
+                    uom_obj = uom_map[uom["code"]] = UOM(code=uom["code"], name=uom["name"], base_uom=base_uom)
+                    to_create.append(uom_obj)
+                    continue
+                changed = uom_obj.name != uom["name"]
+                uom_obj.name = uom["name"]
+                if base_uom is not None and uom_obj.base_uom_id != base_uom.pk:
+                    uom_obj.base_uom = base_uom
+                    changed = True
+                if changed:
+                    uom_obj.modified = now
+                    to_update.append(uom_obj)
+            if len(deferred) == len(pending):
+                missing = ", ".join(uom["code"] for uom in deferred)
+                raise CommandError(f"Base UOM not found for: {missing}")
+            UOM.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+            pending = deferred
+        UOM.objects.bulk_update(to_update, ["name", "base_uom", "modified"], batch_size=BATCH_SIZE)
         self.stdout.write(self.style.SUCCESS("Successfully created UOM objects."))
@@ -0,0 +1,53 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from one.masterdata.uom.management.commands.initial_uom import Command
+from one.masterdata.uom.models import UOM
+
+pytestmark = pytest.mark.django_db
+
+
+def test_initial_uom_seeds_base_uom():
+    call_command("initial_uom", "CREATIVE")
+
+    assert UOM.objects.count() == len(Command.uom_data["CREATIVE"])
+    assert UOM.objects.get(code="UOM_WORD").base_uom is None
+    assert UOM.objects.get(code="UOM_POST_301_500").base_uom.code == "UOM_WORD"
+    assert UOM.objects.get(code="UOM_SCRIPT_60").base_uom.code == "UOM_SECOND"
+
+
+def test_initial_uom_rerun_does_not_write(django_assert_num_queries):
+    call_command("initial_uom", "CREATIVE")
+
+    # savepoint, in_bulk select, savepoint release
+    with django_assert_num_queries(3):
+        call_command("initial_uom", "CREATIVE")
+
+
+def test_initial_uom_updates_changed_rows():
+    last_week = timezone.now() - timedelta(days=7)
+    UOM.objects.create(code="UOM_SECOND", name="Giây")
+    UOM.objects.create(code="UOM_SCRIPT_60", name="Old name")
+    UOM.objects.filter(code="UOM_SCRIPT_60").update(modified=last_week)
+
+    call_command("initial_uom", "CREATIVE")
+
+    uom = UOM.objects.get(code="UOM_SCRIPT_60")
+    assert uom.name == "Kịch bản 60s"
+    assert uom.base_uom.code == "UOM_SECOND"
+    assert uom.modified > last_week
+
+
+def test_initial_uom_missing_base_uom(monkeypatch):
+    monkeypatch.setattr(
+        Command,
+        "uom_data",
+        {"CREATIVE": [{"code": "UOM_ORPHAN", "name": "Orphan", "base_uom": "UOM_MISSING"}]},
+    )
+
+    with pytest.raises(CommandError, match="UOM_ORPHAN"):
+        call_command("initial_uom", "CREATIVE")
+    assert not UOM.objects.filter(code="UOM_ORPHAN").exists()